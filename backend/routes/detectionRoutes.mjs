@@ -17,31 +17,48 @@ const pool = new Pool({
   port: Number(process.env.PG_PORT), // PostgreSQL port - convert to number for type safety
 });
 
-// POST /api/detections - Add a new detection
+// POST /api/detections - Add a new detection, or a batch of detections
+// Body is either { objects: [...] } or { batch: [[...], [...]] }
 router.post('/', async (req, res) => {
-  const { objects } = req.body;
+  const { objects, batch } = req.body;
+  const detectionSets = batch !== undefined ? batch : [objects];
 
   // Validate the request body
-  if (!objects || !Array.isArray(objects)) {
-    console.error('Invalid objects format:', objects);
+  if (
+    !Array.isArray(detectionSets) ||
+    detectionSets.length === 0 ||
+    !detectionSets.every((set) => Array.isArray(set))
+  ) {
+    console.error('Invalid objects format:', batch !== undefined ? batch : objects);
     return res.status(400).json({ error: 'Invalid objects format' });
   }
 
   try {
-    // Insert the detection data into the 'detections' table
-    const query = 'INSERT INTO detections (data) VALUES ($1) RETURNING *';
-    const result = await pool.query(query, [JSON.stringify(objects)]);
-    const detection = result.rows[0];
+    // Insert every detection in a single statement; the batch is sent as one
+    // JSON document and split into rows server-side
+    const query = `
+      INSERT INTO detections (data)
+      SELECT value FROM jsonb_array_elements($1::jsonb)
+      RETURNING *
+    `;
+    const result = await pool.query(query, [JSON.stringify(detectionSets)]);
 
-    res.status(201).json(detection);
+    res.status(201).json(batch !== undefined ? result.rows : result.rows[0]);
 
-    // Emit a WebSocket event for new detection
+    // Emit a single WebSocket event for the new detection(s).
+    // Live clients should subscribe to 'new-detections', which carries an
+    // array of rows: the ObjectDetection component only posts { batch }.
+    // 'new-detection' (one row) is still emitted for legacy { objects } posts.
     // Option 1: Using emitSocketEvent helper function (recommended)
-    emitSocketEvent('new-detection', detection);
+    if (batch !== undefined) {
+      emitSocketEvent('new-detections', result.rows);
+    } else {
+      emitSocketEvent('new-detection', result.rows[0]);
+    }
     
     // Option 2: Using getIO() to get the Socket.IO instance
     // const io = getIO();
-    // io.emit('new-detection', detection);
+    // io.emit('new-detections', result.rows);
   } catch (err) {
     console.error('Error inserting detection:', err);
     res.status(500).json({ error: 'Internal Server Error' });
@@ -7,6 +7,23 @@ import moment from 'moment'; // For timestamp formatting
 // Get a detection sound
 const detectionSound = getDetectionSound();
 
+// Fraction of the native video resolution handed to the model.
+// Boxes are scaled back up to the native resolution before drawing.
+const DETECTION_SCALE = 0.5;
+
+// Number of frames with predictions sent to the backend per request
+const DETECTION_BATCH_SIZE = 10;
+
+// Longest a queued frame waits before a partial batch is sent, in milliseconds
+const DETECTION_FLUSH_DELAY = 500;
+
+// Most frames kept queued for retry while uploads are failing
+const MAX_PENDING_DETECTIONS = 100;
+
+// Only the most recent entries are rendered, so only those are kept
+const MAX_LOGS = 10;
+const MAX_GALLERY_IMAGES = 5;
+
 const colors = {
   gold: '#FFD700',
   black: '#000000',
@@ -141,6 +158,7 @@ const LoadingSpinner = styled.div`
 const ObjectDetection = () => {
   const videoRef = useRef(null);
   const canvasRef = useRef(null);
+  const detectionAudioRef = useRef(null);
   const [model, setModel] = useState(null);
   const [isVideoPlaying, setIsVideoPlaying] = useState(false);
   const [isLoading, setIsLoading] = useState(true);
@@ -208,7 +226,12 @@ const ObjectDetection = () => {
 
   const playDetectionSound = () => {
     try {
-      const audio = new Audio(detectionSound);
+      // Reuse a single audio element rather than decoding the clip on every play
+      if (!detectionAudioRef.current) {
+        detectionAudioRef.current = new Audio(detectionSound);
+      }
+      const audio = detectionAudioRef.current;
+      audio.currentTime = 0;
       audio.play().catch(e => console.error('Error playing detection sound:', e));
     } catch (err) {
       console.error('Error creating audio:', err);
@@ -216,76 +239,215 @@ const ObjectDetection = () => {
   };
 
   useEffect(() => {
-    let intervalId;
+    let timeoutId;
+    let isStopped = false;
 
     if (model && isVideoPlaying) {
       const video = videoRef.current;
       const canvas = canvasRef.current;
       const ctx = canvas.getContext('2d');
 
+      // Offscreen canvas holding the downscaled frame the model runs on
+      const detectionCanvas = document.createElement('canvas');
+      const detectionCtx = detectionCanvas.getContext('2d');
+
+      // Native-to-detection size ratios, set once the video size is known.
+      // Taken from the rounded canvas size so odd dimensions map back exactly.
+      let scaleX = 1;
+      let scaleY = 1;
+
+      // Frames of predictions waiting to be sent to the backend
+      const pendingDetections = [];
+      let flushTimeoutId = null;
+      let isFlushing = false;
+
+      const flushDetections = async () => {
+        clearTimeout(flushTimeoutId);
+        flushTimeoutId = null;
+        // One request in flight at a time; frames queued meanwhile are sent
+        // once it settles
+        if (isFlushing || pendingDetections.length === 0) return;
+
+        isFlushing = true;
+        // Never more than one batch per request, so a backlog built up during
+        // an outage stays under the backend's JSON body limit
+        const batch = pendingDetections.splice(0, DETECTION_BATCH_SIZE);
+        let failed = false;
+        try {
+          await axios.post('/api/detections', { batch });
+        } catch (error) {
+          console.error('Error sending detections to backend:', error);
+          // Don't set error here as it might disrupt the UI constantly
+
+          if (!error.response || error.response.status >= 500) {
+            // Network error or server fault: requeue the batch ahead of newer
+            // frames, keeping the oldest out once the queue is full
+            failed = true;
+            pendingDetections.unshift(...batch);
+            const overflow = pendingDetections.length - MAX_PENDING_DETECTIONS;
+            if (overflow > 0) {
+              pendingDetections.splice(0, overflow);
+              console.warn(`Dropped ${overflow} unsent detection frame(s) after failed uploads`);
+            }
+          } else {
+            // The backend rejected the batch (400, 403, 413, ...); resending it won't help
+            console.warn(
+              `Dropped ${batch.length} detection frame(s) rejected by the backend with status ${error.response.status}`
+            );
+          }
+        } finally {
+          isFlushing = false;
+        }
+
+        if (pendingDetections.length === 0) return;
+        if (!failed) {
+          // Keep draining the queue one batch at a time, including frames
+          // queued during the request or after detection stopped
+          flushDetections();
+        } else if (!isStopped) {
+          // Retry after the usual delay
+          flushTimeoutId = setTimeout(flushDetections, DETECTION_FLUSH_DELAY);
+        } else {
+          console.warn(
+            `Dropped ${pendingDetections.length} unsent detection frame(s) after detection stopped`
+          );
+          pendingDetections.length = 0;
+        }
+      };
+
+      // Send whatever is queued when the page is hidden or unloaded, since the
+      // effect cleanup below doesn't run on reload, tab close or navigation
+      const handleVisibilityChange = () => {
+        if (document.visibilityState === 'hidden') {
+          flushDetections();
+        }
+      };
+
       const detect = async () => {
         if (!isVideoPlaying) return;
 
-        const predictions = await detectObjects(model, video);
+        // Capture time of the frame, stored with each of its predictions
+        const detectedAt = new Date().toISOString();
+        detectionCtx.drawImage(
+          video,
+          0,
+          0,
+          detectionCanvas.width,
+          detectionCanvas.height
+        );
+        const predictions = (await detectObjects(model, detectionCanvas)).map(
+          (prediction) => ({
+            ...prediction,
+            bbox: [
+              prediction.bbox[0] * scaleX,
+              prediction.bbox[1] * scaleY,
+              prediction.bbox[2] * scaleX,
+              prediction.bbox[3] * scaleY,
+            ],
+            detectedAt,
+          })
+        );
 
         ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
 
-        predictions
-          .filter((prediction) => prediction.score >= threshold)
-          .forEach((prediction) => {
-            const [x, y, width, height] = prediction.bbox;
-            ctx.strokeStyle = colors.gold;
-            ctx.lineWidth = 2;
-            ctx.strokeRect(x, y, width, height);
-            ctx.font = '18px Arial';
-            ctx.fillStyle = colors.gold;
-            ctx.fillText(
-              `${prediction.class} (${Math.round(prediction.score * 100)}%)`,
-              x,
-              y > 10 ? y - 5 : 10
-            );
+        // One timestamp per frame; every detection in it shares the same time
+        const timestamp = moment().format('HH:mm:ss');
+
+        const confidentPredictions = predictions.filter(
+          (prediction) => prediction.score >= threshold
+        );
+
+        confidentPredictions.forEach((prediction) => {
+          const [x, y, width, height] = prediction.bbox;
+          ctx.strokeStyle = colors.gold;
+          ctx.lineWidth = 2;
+          ctx.strokeRect(x, y, width, height);
+          ctx.font = '18px Arial';
+          ctx.fillStyle = colors.gold;
+          ctx.fillText(
+            `${prediction.class} (${Math.round(prediction.score * 100)}%)`,
+            x,
+            y > 10 ? y - 5 : 10
+          );
+        });
 
-            // Play sound if a person is detected
-            if (prediction.class === 'person') {
-              playDetectionSound();
-            }
+        if (confidentPredictions.length > 0) {
+          // Add to logs
+          const frameLogs = confidentPredictions.map((prediction) => ({
+            timestamp,
+            object: prediction.class,
+          }));
+          setLogs((prevLogs) =>
+            [...frameLogs.reverse(), ...prevLogs].slice(0, MAX_LOGS)
+          );
+
+          // Take a single screenshot of the fully drawn frame and add to gallery
+          const dataUrl = canvas.toDataURL('image/png');
+          setGallery((prevGallery) =>
+            [dataUrl, ...prevGallery].slice(0, MAX_GALLERY_IMAGES)
+          );
+        }
 
-            // Add to logs
-            const timestamp = moment().format('HH:mm:ss');
-            setLogs((prevLogs) => [
-              { timestamp, object: prediction.class },
-              ...prevLogs,
-            ]);
-
-            // Take a screenshot and add to gallery
-            if (canvas) {
-              const dataUrl = canvas.toDataURL('image/png');
-              setGallery((prevGallery) => [dataUrl, ...prevGallery]);
-            }
-          });
+        // Play sound once per frame if a person is detected
+        if (confidentPredictions.some((prediction) => prediction.class === 'person')) {
+          playDetectionSound();
+        }
+
+        // Queue detections and send them to the backend in batches. A
+        // detection still running when the effect is torn down is dropped
+        // here, since the final flush has already happened.
+        if (predictions.length > 0 && !isStopped) {
+          pendingDetections.push(predictions);
+          if (pendingDetections.length >= DETECTION_BATCH_SIZE) {
+            // Not awaited so the next frame isn't held up by the request
+            flushDetections();
+          } else if (flushTimeoutId === null) {
+            flushTimeoutId = setTimeout(flushDetections, DETECTION_FLUSH_DELAY);
+          }
+        }
+      };
 
-        // Send detections to backend
+      // Schedule the next detection only once the current one has finished,
+      // so slow inference never piles up overlapping detect() calls. The time
+      // spent detecting counts towards the interval, so ticks start every
+      // detectionInterval ms when inference keeps up and back-to-back when not.
+      const runDetection = async () => {
+        const startedAt = performance.now();
         try {
-          await axios.post('/api/detections', {
-            objects: predictions,
-          });
-        } catch (error) {
-          console.error('Error sending detections to backend:', error);
-          // Don't set error here as it might disrupt the UI constantly
+          await detect();
+        } catch (err) {
+          console.error('Error running detection:', err);
+        }
+        if (!isStopped) {
+          const elapsed = performance.now() - startedAt;
+          timeoutId = setTimeout(
+            runDetection,
+            Math.max(0, detectionInterval - elapsed)
+          );
         }
       };
 
       const startDetection = () => {
         canvas.width = video.videoWidth;
         canvas.height = video.videoHeight;
-        intervalId = setInterval(detect, detectionInterval);
+        detectionCanvas.width = Math.round(video.videoWidth * DETECTION_SCALE);
+        detectionCanvas.height = Math.round(video.videoHeight * DETECTION_SCALE);
+        scaleX = video.videoWidth / detectionCanvas.width;
+        scaleY = video.videoHeight / detectionCanvas.height;
+        runDetection();
       };
 
       video.addEventListener('loadeddata', startDetection);
+      window.addEventListener('pagehide', flushDetections);
+      document.addEventListener('visibilitychange', handleVisibilityChange);
 
       return () => {
-        clearInterval(intervalId);
+        isStopped = true;
+        clearTimeout(timeoutId);
         video.removeEventListener('loadeddata', startDetection);
+        window.removeEventListener('pagehide', flushDetections);
+        document.removeEventListener('visibilitychange', handleVisibilityChange);
+        flushDetections();
       };
     }
   }, [model, isVideoPlaying, threshold, detectionInterval]);
@@ -350,7 +512,7 @@ const ObjectDetection = () => {
           {logs.length > 0 && (
             <LogsContainer>
               <h2>Detection Logs</h2>
-              {logs.slice(0, 10).map((log, index) => (
+              {logs.map((log, index) => (
                 <LogItem key={index}>
                   [{log.timestamp}] Detected: {log.object}
                 </LogItem>
@@ -361,7 +523,7 @@ const ObjectDetection = () => {
           {gallery.length > 0 && (
             <GalleryContainer>
               <h2>Screenshot Gallery</h2>
-              {gallery.slice(0, 5).map((image, index) => (
+              {gallery.map((image, index) => (
                 <Screenshot
                   key={index}
                   src={image}